@@ -1,4 +1,5 @@
 import json
+import os
 
 import pytest
 import schemathesis
@@ -14,7 +15,9 @@ from schemathesis.checks import (
 schemathesis.experimental.OPEN_API_3_1.enable()
 
 SCHEMA_URL = "https://raw.githubusercontent.com/stapi-spec/stapi-spec/refs/heads/main/openapi.yaml"
-schema = schemathesis.from_uri(SCHEMA_URL)
+# Set to a downloaded copy of the specification to skip fetching it on every run
+SCHEMA_PATH = os.environ.get("STAPI_OPENAPI_SCHEMA")
+schema = schemathesis.from_path(SCHEMA_PATH) if SCHEMA_PATH else schemathesis.from_uri(SCHEMA_URL)
 
 BASE_URL = "http://localhost:8000"
 
@@ -47,15 +50,13 @@ def pytest_runtest_makereport(item, call):
 
 def pytest_sessionfinish(session, exitstatus):
     if hasattr(session, "results"):
+        results = {
+            nodeid: {
+                "outcome": rep.outcome,
+                "longrepr": str(rep.longrepr) if rep.longrepr else None,
+            }
+            for nodeid, rep in session.results.items()
+        }
+        # json.dump issues a write per encoded chunk; encode once and write once
         with open("test_results.json", "w") as f:
-            json.dump(
-                {
-                    nodeid: {
-                        "outcome": rep.outcome,
-                        "longrepr": str(rep.longrepr) if rep.longrepr else None,
-                    }
-                    for nodeid, rep in session.results.items()
-                },
-                f,
-                indent=2,
-            )
+            f.write(json.dumps(results, indent=2))
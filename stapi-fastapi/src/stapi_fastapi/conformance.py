@@ -2,29 +2,38 @@
 # attributes, to make it pleasant to use in an editor with autocompletion.
 
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from stapi_pydantic.constants import STAPI_VERSION
 
+_STAPI_URL = f"https://stapi.example.com/v{STAPI_VERSION}"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _All:
+    _all: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The conformances never change, so collect them once rather than on every call
+        values = tuple(getattr(self, f.name) for f in dataclasses.fields(self) if f.init)
+        object.__setattr__(self, "_all", values)
+
     def all(self) -> list[str]:
-        return [getattr(self, field.name) for field in dataclasses.fields(self)]
+        return list(self._all)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Api(_All):
-    core: str = f"https://stapi.example.com/v{STAPI_VERSION}/core"
-    order_statuses: str = f"https://stapi.example.com/v{STAPI_VERSION}/order-statuses"
-    searches_opportunity: str = f"https://stapi.example.com/v{STAPI_VERSION}/searches-opportunity"
-    searches_opportunity_statuses: str = f"https://stapi.example.com/v{STAPI_VERSION}/searches-opportunity-statuses"
+    core: str = f"{_STAPI_URL}/core"
+    order_statuses: str = f"{_STAPI_URL}/order-statuses"
+    searches_opportunity: str = f"{_STAPI_URL}/searches-opportunity"
+    searches_opportunity_statuses: str = f"{_STAPI_URL}/searches-opportunity-statuses"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Product(_All):
-    opportunities: str = f"https://stapi.example.com/v{STAPI_VERSION}/opportunities"
-    opportunities_async: str = f"https://stapi.example.com/v{STAPI_VERSION}/opportunities-async"
+    opportunities: str = f"{_STAPI_URL}/opportunities"
+    opportunities_async: str = f"{_STAPI_URL}/opportunities-async"
     geojson_point: str = "https://geojson.org/schema/Point.json"
     geojson_linestring: str = "https://geojson.org/schema/LineString.json"
     geojson_polygon: str = "https://geojson.org/schema/Polygon.json"
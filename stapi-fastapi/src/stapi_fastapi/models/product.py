@@ -19,6 +19,8 @@ class Product(BaseProduct):
     _search_opportunities: SearchOpportunities | None
     _search_opportunities_async: SearchOpportunitiesAsync | None
     _get_opportunity_collection: GetOpportunityCollection | None
+    _supports_opportunity_search: bool
+    _supports_async_opportunity_search: bool
 
     # we don't want to include these in the model fields
     _queryables: type[Queryables]
@@ -39,7 +41,7 @@ class Product(BaseProduct):
     ) -> None:
         super().__init__(*args, **kwargs)
 
-        if bool(search_opportunities_async) != bool(get_opportunity_collection):
+        if (search_opportunities_async is None) != (get_opportunity_collection is None):
             raise ValueError(
                 "Both the `search_opportunities_async` and `get_opportunity_collection` "
                 "arguments must be provided if either is provided"
@@ -49,6 +51,12 @@ class Product(BaseProduct):
         self._search_opportunities = search_opportunities
         self._search_opportunities_async = search_opportunities_async
         self._get_opportunity_collection = get_opportunity_collection
+        # The search callables are fixed at construction, so work out what is
+        # supported here instead of on every request
+        self._supports_opportunity_search = search_opportunities is not None
+        self._supports_async_opportunity_search = (
+            search_opportunities_async is not None and get_opportunity_collection is not None
+        )
         self._queryables = queryables
         self._opportunity_properties = opportunity_properties
         self._order_parameters = order_parameters
@@ -59,29 +67,29 @@ class Product(BaseProduct):
 
     @property
     def search_opportunities(self) -> SearchOpportunities:
-        if not self._search_opportunities:
+        if (search_opportunities := self._search_opportunities) is None:
             raise AttributeError("This product does not support opportunity search")
-        return self._search_opportunities
+        return search_opportunities
 
     @property
     def search_opportunities_async(self) -> SearchOpportunitiesAsync:
-        if not self._search_opportunities_async:
+        if (search_opportunities_async := self._search_opportunities_async) is None:
             raise AttributeError("This product does not support async opportunity search")
-        return self._search_opportunities_async
+        return search_opportunities_async
 
     @property
     def get_opportunity_collection(self) -> GetOpportunityCollection:
-        if not self._get_opportunity_collection:
+        if (get_opportunity_collection := self._get_opportunity_collection) is None:
             raise AttributeError("This product does not support async opportunity search")
-        return self._get_opportunity_collection
+        return get_opportunity_collection
 
     @property
     def supports_opportunity_search(self) -> bool:
-        return self._search_opportunities is not None
+        return self._supports_opportunity_search
 
     @property
     def supports_async_opportunity_search(self) -> bool:
-        return self._search_opportunities_async is not None and self._get_opportunity_collection is not None
+        return self._supports_async_opportunity_search
 
     @property
     def queryables(self) -> type[Queryables]:
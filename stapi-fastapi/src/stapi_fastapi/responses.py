@@ -1,7 +1,55 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from stapi_fastapi.constants import TYPE_GEOJSON, TYPE_JSON
+
 
-from stapi_fastapi.constants import TYPE_GEOJSON
+class ModelJSONResponse(JSONResponse):
+    """
+    JSON response that renders pydantic models with pydantic-core's JSON serializer.
 
+    Returning one of these from an endpoint skips FastAPI's response model
+    handling, which dumps, re-validates, and re-serializes the model before
+    encoding it again with the stdlib `json` module.
+    """
 
-class GeoJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode("utf-8")
+        return super().render(content)
+
+
+class GeoJSONResponse(ModelJSONResponse):
     media_type = TYPE_GEOJSON
+
+
+class StaticJSONDocument:
+    """
+    A JSON document that is rendered once and served with a strong ETag.
+
+    Requests whose `If-None-Match` header matches the ETag are answered with
+    304 Not Modified and no body.
+    """
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, model: BaseModel) -> None:
+        self.body = model.model_dump_json(by_alias=True).encode("utf-8")
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=16).hexdigest()}"'
+
+    def response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag}
+        if self.matches(request.headers.get("If-None-Match")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type=TYPE_JSON, headers=headers)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if if_none_match is None:
+            return False
+        # If-None-Match uses weak comparison, so W/ prefixed tags match too
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import traceback
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from fastapi import (
     APIRouter,
@@ -37,7 +37,7 @@ from stapi_fastapi.conformance import PRODUCT as PRODUCT_CONFORMACES
 from stapi_fastapi.constants import TYPE_JSON
 from stapi_fastapi.errors import NotFoundError, QueryablesError
 from stapi_fastapi.models.product import Product
-from stapi_fastapi.responses import GeoJSONResponse
+from stapi_fastapi.responses import GeoJSONResponse, StaticJSONDocument
 from stapi_fastapi.routers.route_names import (
     CONFORMANCE,
     CREATE_ORDER,
@@ -53,18 +53,28 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PREFER_BY_VALUE: dict[str, Prefer] = {p.value: p for p in Prefer}
 
-def get_prefer(prefer: str | None = Header(None)) -> str | None:
+# shared by every product's opportunity search route; FastAPI only reads it
+SEARCH_OPPORTUNITIES_RESPONSES: dict[int | str, dict[str, Any]] = {
+    201: {
+        "model": OpportunitySearchRecord,
+        "content": {TYPE_JSON: {}},
+    }
+}
+
+
+def get_prefer(prefer: str | None = Header(None)) -> Prefer | None:
     if prefer is None:
         return None
 
-    if prefer not in Prefer._value2member_map_:
+    if (member := PREFER_BY_VALUE.get(prefer)) is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid Prefer header value: {prefer}",
         )
 
-    return Prefer(prefer)
+    return member
 
 
 def build_conformances(product: Product, root_router: RootRouter) -> list[str]:
@@ -85,6 +95,25 @@ def build_conformances(product: Product, root_router: RootRouter) -> list[str]:
 
 
 class ProductRouter(APIRouter):
+    # APIRouter instances still carry a __dict__, but keeping the attributes this
+    # router adds in slots avoids growing it for every product that is mounted
+    __slots__ = ("product", "root_router", "conformances", "_conformance")
+
+    # (path, endpoint method, route name, summary, response model) of the GET routes
+    # every product has, built once rather than spelled out for each instance
+    STATIC_ROUTES: ClassVar[tuple[tuple[str, str, str, str, Any], ...]] = (
+        ("", "get_product", GET_PRODUCT, "Retrieve this product", ProductPydantic),
+        ("/conformance", "get_product_conformance", CONFORMANCE, "Get conformance urls for the product", Conformance),
+        ("/queryables", "get_product_queryables", GET_QUERYABLES, "Get queryables for the product", JsonSchemaModel),
+        (
+            "/order-parameters",
+            "get_product_order_parameters",
+            GET_ORDER_PARAMETERS,
+            "Get order parameters for the product",
+            JsonSchemaModel,
+        ),
+    )
+
     # FIXME ruff is complaining that the init is too complex
     def __init__(  # noqa
         self,
@@ -98,42 +127,19 @@ class ProductRouter(APIRouter):
         self.product = product
         self.root_router = root_router
         self.conformances = build_conformances(product, root_router)
+        # the conformance document never changes once the router is built
+        self._conformance = StaticJSONDocument(Conformance.model_validate({"conforms_to": self.conformances}))
 
-        self.add_api_route(
-            path="",
-            endpoint=self.get_product,
-            name=f"{self.root_router.name}:{self.product.id}:{GET_PRODUCT}",
-            methods=["GET"],
-            summary="Retrieve this product",
-            tags=["Products"],
-        )
-
-        self.add_api_route(
-            path="/conformance",
-            endpoint=self.get_product_conformance,
-            name=f"{self.root_router.name}:{self.product.id}:{CONFORMANCE}",
-            methods=["GET"],
-            summary="Get conformance urls for the product",
-            tags=["Products"],
-        )
-
-        self.add_api_route(
-            path="/queryables",
-            endpoint=self.get_product_queryables,
-            name=f"{self.root_router.name}:{self.product.id}:{GET_QUERYABLES}",
-            methods=["GET"],
-            summary="Get queryables for the product",
-            tags=["Products"],
-        )
-
-        self.add_api_route(
-            path="/order-parameters",
-            endpoint=self.get_product_order_parameters,
-            name=f"{self.root_router.name}:{self.product.id}:{GET_ORDER_PARAMETERS}",
-            methods=["GET"],
-            summary="Get order parameters for the product",
-            tags=["Products"],
-        )
+        for path, endpoint, name, summary, response_model in self.STATIC_ROUTES:
+            self.add_api_route(
+                path=path,
+                endpoint=getattr(self, endpoint),
+                name=f"{self.root_router.name}:{self.product.id}:{name}",
+                methods=["GET"],
+                response_model=response_model,
+                summary=summary,
+                tags=["Products"],
+            )
 
         # This wraps `self.create_order` to explicitly parameterize `OrderRequest`
         # for this Product. This must be done programmatically instead of with a type
@@ -146,8 +152,9 @@ class ProductRouter(APIRouter):
             payload: OrderPayload,  # type: ignore
             request: Request,
             response: Response,
-        ) -> Order[OrderStatus]:
-            return await self.create_order(payload, request, response)
+        ) -> GeoJSONResponse:
+            order = await self.create_order(payload, request, response)
+            return GeoJSONResponse(order, status_code=status.HTTP_201_CREATED, headers=response.headers)
 
         _create_order.__annotations__["payload"] = OrderPayload[
             self.product.order_parameters  # type: ignore
@@ -159,6 +166,7 @@ class ProductRouter(APIRouter):
             name=f"{self.root_router.name}:{self.product.id}:{CREATE_ORDER}",
             methods=["POST"],
             response_class=GeoJSONResponse,
+            response_model=Order[OrderStatus],
             status_code=status.HTTP_201_CREATED,
             summary="Create an order for the product",
             tags=["Products"],
@@ -178,12 +186,7 @@ class ProductRouter(APIRouter):
                     Geometry,
                     self.product.opportunity_properties,  # type: ignore
                 ],
-                responses={
-                    201: {
-                        "model": OpportunitySearchRecord,
-                        "content": {TYPE_JSON: {}},
-                    }
-                },
+                responses=SEARCH_OPPORTUNITIES_RESPONSES,
                 summary="Search Opportunities for the product",
                 tags=["Products"],
             )
@@ -195,6 +198,7 @@ class ProductRouter(APIRouter):
                 name=f"{self.root_router.name}:{self.product.id}:{GET_OPPORTUNITY_COLLECTION}",
                 methods=["GET"],
                 response_class=GeoJSONResponse,
+                response_model=OpportunityCollection,
                 summary="Get an Opportunity Collection by ID",
                 tags=["Products"],
             )
@@ -352,11 +356,11 @@ class ProductRouter(APIRouter):
             case x:
                 raise AssertionError(f"Expected code to be unreachable: {x}")
 
-    def get_product_conformance(self) -> Conformance:
+    def get_product_conformance(self, request: Request) -> Response:
         """
         Return conformance urls of a specific product
         """
-        return Conformance.model_validate({"conforms_to": self.conformances})
+        return self._conformance.response(request)
 
     def get_product_queryables(self) -> JsonSchemaModel:
         """
@@ -418,9 +422,7 @@ class ProductRouter(APIRouter):
             body=body,
         )
 
-    async def get_opportunity_collection(
-        self, opportunity_collection_id: str, request: Request
-    ) -> OpportunityCollection:  # type: ignore
+    async def get_opportunity_collection(self, opportunity_collection_id: str, request: Request) -> GeoJSONResponse:
         """
         Fetch an opportunity collection generated by an asynchronous opportunity search.
         """
@@ -441,7 +443,7 @@ class ProductRouter(APIRouter):
                         type=TYPE_JSON,
                     ),
                 )
-                return opportunity_collection  # type: ignore
+                return GeoJSONResponse(opportunity_collection)
             case Success(Maybe.empty):
                 raise NotFoundError("Opportunity Collection not found")
             case Failure(e):
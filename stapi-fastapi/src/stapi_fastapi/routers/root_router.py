@@ -1,8 +1,8 @@
 import logging
 import traceback
-from typing import Any
+from typing import Any, ClassVar
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from returns.maybe import Maybe, Some
 from returns.result import Failure, Success
 from stapi_pydantic import (
@@ -18,6 +18,7 @@ from stapi_pydantic import (
     ProductsCollection,
     RootResponse,
 )
+from starlette.routing import BaseRoute
 
 from stapi_fastapi.backends.root_backend import (
     GetOpportunitySearchRecord,
@@ -31,7 +32,7 @@ from stapi_fastapi.conformance import API as API_CONFORMANCE
 from stapi_fastapi.constants import TYPE_GEOJSON, TYPE_JSON
 from stapi_fastapi.errors import NotFoundError
 from stapi_fastapi.models.product import Product
-from stapi_fastapi.responses import GeoJSONResponse
+from stapi_fastapi.responses import GeoJSONResponse, ModelJSONResponse, StaticJSONDocument
 from stapi_fastapi.routers.product_router import ProductRouter
 from stapi_fastapi.routers.route_names import (
     CONFORMANCE,
@@ -49,6 +50,36 @@ logger = logging.getLogger(__name__)
 
 
 class RootRouter(APIRouter):
+    # as with ProductRouter, APIRouter still provides a __dict__; the state this
+    # router adds lives in slots
+    __slots__ = (
+        "_get_orders",
+        "_get_order",
+        "__get_order_statuses",
+        "__get_opportunity_search_records",
+        "__get_opportunity_search_record",
+        "__get_opportunity_search_record_statuses",
+        "name",
+        "openapi_endpoint_name",
+        "docs_endpoint_name",
+        "product_ids",
+        "product_indexes",
+        "product_routers",
+        "product_routes",
+        "conformances",
+        "_conformance",
+    )
+
+    # (path, endpoint method, route name, response class, response model, tag) of the
+    # GET routes every root router has, built once rather than spelled out per instance
+    STATIC_ROUTES: ClassVar[tuple[tuple[str, str, str, type[ModelJSONResponse], Any, str], ...]] = (
+        ("/", "get_root", ROOT, ModelJSONResponse, RootResponse, "Root"),
+        ("/conformance", "get_conformance", CONFORMANCE, ModelJSONResponse, Conformance, "Conformance"),
+        ("/products", "get_products", LIST_PRODUCTS, ModelJSONResponse, ProductsCollection, "Products"),
+        ("/orders", "get_orders", LIST_ORDERS, GeoJSONResponse, OrderCollection[OrderStatus], "Orders"),
+        ("/orders/{order_id}", "get_order", GET_ORDER, GeoJSONResponse, Order[OrderStatus], "Orders"),
+    )
+
     def __init__(
         self,
         get_orders: GetOrders,
@@ -78,54 +109,28 @@ class RootRouter(APIRouter):
         self.openapi_endpoint_name = openapi_endpoint_name
         self.docs_endpoint_name = docs_endpoint_name
         self.product_ids: list[str] = []
+        # position of each id in product_ids, for resolving pagination tokens
+        self.product_indexes: dict[str, int] = {}
 
         # A dict is used to track the product routers so we can ensure
         # idempotentcy in case a product is added multiple times, and also to
         # manage clobbering if multiple products with the same product_id are
         # added.
         self.product_routers: dict[str, ProductRouter] = {}
+        # the routes each product router was included as, so they can be removed
+        # when the product is replaced
+        self.product_routes: dict[str, list[BaseRoute]] = {}
 
-        self.add_api_route(
-            "/",
-            self.get_root,
-            methods=["GET"],
-            name=f"{self.name}:{ROOT}",
-            tags=["Root"],
-        )
-
-        self.add_api_route(
-            "/conformance",
-            self.get_conformance,
-            methods=["GET"],
-            name=f"{self.name}:{CONFORMANCE}",
-            tags=["Conformance"],
-        )
-
-        self.add_api_route(
-            "/products",
-            self.get_products,
-            methods=["GET"],
-            name=f"{self.name}:{LIST_PRODUCTS}",
-            tags=["Products"],
-        )
-
-        self.add_api_route(
-            "/orders",
-            self.get_orders,
-            methods=["GET"],
-            name=f"{self.name}:{LIST_ORDERS}",
-            response_class=GeoJSONResponse,
-            tags=["Orders"],
-        )
-
-        self.add_api_route(
-            "/orders/{order_id}",
-            self.get_order,
-            methods=["GET"],
-            name=f"{self.name}:{GET_ORDER}",
-            response_class=GeoJSONResponse,
-            tags=["Orders"],
-        )
+        for path, endpoint, route_name, response_class, response_model, tag in self.STATIC_ROUTES:
+            self.add_api_route(
+                path,
+                getattr(self, endpoint),
+                methods=["GET"],
+                name=f"{self.name}:{route_name}",
+                response_class=response_class,
+                response_model=response_model,
+                tags=[tag],
+            )
 
         if self.get_order_statuses is not None:
             _conformances.add(API_CONFORMANCE.order_statuses)
@@ -134,6 +139,7 @@ class RootRouter(APIRouter):
                 self.get_order_statuses,
                 methods=["GET"],
                 name=f"{self.name}:{LIST_ORDER_STATUSES}",
+                response_model=OrderStatuses,
                 tags=["Orders"],
             )
 
@@ -169,12 +175,15 @@ class RootRouter(APIRouter):
             )
 
         self.conformances = list(_conformances)
+        # unlike the root document, which links to request-relative URLs, the
+        # conformance document is the same for every request
+        self._conformance = StaticJSONDocument(Conformance(conforms_to=self.conformances))
 
     @staticmethod
     def url_for(request: Request, name: str, /, **path_params: Any) -> str:
         return str(request.url_for(name, **path_params))
 
-    def get_root(self, request: Request) -> RootResponse:
+    def get_root(self, request: Request) -> ModelJSONResponse:
         links = [
             Link(
                 href=self.url_for(request, f"{self.name}:{ROOT}"),
@@ -217,22 +226,24 @@ class RootRouter(APIRouter):
                 ),
             )
 
-        return RootResponse(
-            id="STAPI API",
-            conformsTo=self.conformances,
-            links=links,
+        return ModelJSONResponse(
+            RootResponse(
+                id="STAPI API",
+                conformsTo=self.conformances,
+                links=links,
+            )
         )
 
-    def get_conformance(self) -> Conformance:
-        return Conformance(conforms_to=self.conformances)
+    def get_conformance(self, request: Request) -> Response:
+        return self._conformance.response(request)
 
-    def get_products(self, request: Request, next: str | None = None, limit: int = 10) -> ProductsCollection:
+    def get_products(self, request: Request, next: str | None = None, limit: int = 10) -> ModelJSONResponse:
         start = 0
         limit = min(limit, 100)
         try:
             if next:
-                start = self.product_ids.index(next)
-        except ValueError:
+                start = self.product_indexes[next]
+        except KeyError:
             logger.exception("An error occurred while retrieving products")
             raise NotFoundError(detail="Error finding pagination token for products") from None
         end = start + limit
@@ -246,14 +257,14 @@ class RootRouter(APIRouter):
         ]
         if end > 0 and end < len(self.product_ids):
             links.append(self.pagination_link(request, self.product_ids[end], limit))
-        return ProductsCollection(
-            products=[self.product_routers[product_id].get_product(request) for product_id in ids],
-            links=links,
+        return ModelJSONResponse(
+            ProductsCollection(
+                products=[self.product_routers[product_id].get_product(request) for product_id in ids],
+                links=links,
+            )
         )
 
-    async def get_orders(
-        self, request: Request, next: str | None = None, limit: int = 10
-    ) -> OrderCollection[OrderStatus]:
+    async def get_orders(self, request: Request, next: str | None = None, limit: int = 10) -> GeoJSONResponse:
         links: list[Link] = []
         match await self._get_orders(next, limit, request):
             case Success((orders, maybe_pagination_token)):
@@ -277,16 +288,16 @@ class RootRouter(APIRouter):
                 )
             case _:
                 raise AssertionError("Expected code to be unreachable")
-        return OrderCollection(features=orders, links=links)
+        return GeoJSONResponse(OrderCollection(features=orders, links=links))
 
-    async def get_order(self, order_id: str, request: Request) -> Order[OrderStatus]:
+    async def get_order(self, order_id: str, request: Request) -> GeoJSONResponse:
         """
         Get details for order with `order_id`.
         """
         match await self._get_order(order_id, request):
             case Success(Some(order)):
                 order.links.extend(self.order_links(order, request))
-                return order  # type: ignore
+                return GeoJSONResponse(order)
             case Success(Maybe.empty):
                 raise NotFoundError("Order not found")
             case Failure(e):
@@ -308,7 +319,7 @@ class RootRouter(APIRouter):
         request: Request,
         next: str | None = None,
         limit: int = 10,
-    ) -> OrderStatuses:  # type: ignore
+    ) -> ModelJSONResponse:
         links: list[Link] = []
         match await self._get_order_statuses(order_id, next, limit, request):
             case Success(Some((statuses, maybe_pagination_token))):
@@ -333,14 +344,28 @@ class RootRouter(APIRouter):
                 )
             case _:
                 raise AssertionError("Expected code to be unreachable")
-        return OrderStatuses(statuses=statuses, links=links)
+        return ModelJSONResponse(OrderStatuses(statuses=statuses, links=links))
 
     def add_product(self, product: Product, *args: Any, **kwargs: Any) -> None:
+        if (existing := self.product_routers.get(product.id)) is not None:
+            # Adding an equal product again would only mount a second, unreachable
+            # copy of its routes
+            if existing.product == product:
+                return
+            # A different product with the same id replaces the mounted one, whose
+            # routes would otherwise keep matching first
+            mounted = {id(route) for route in self.product_routes.pop(product.id)}
+            self.routes[:] = [route for route in self.routes if id(route) not in mounted]
+
         # Give the include a prefix from the product router
         product_router = ProductRouter(product, self, *args, **kwargs)
+        first = len(self.routes)
         self.include_router(product_router, prefix=f"/products/{product.id}")
+        self.product_routes[product.id] = self.routes[first:]
         self.product_routers[product.id] = product_router
-        self.product_ids = [*self.product_routers.keys()]
+        if existing is None:
+            self.product_indexes[product.id] = len(self.product_ids)
+            self.product_ids.append(product.id)
 
     def generate_order_href(self, request: Request, order_id: str) -> str:
         return self.url_for(request, f"{self.name}:{GET_ORDER}", order_id=order_id)
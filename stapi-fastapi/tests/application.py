@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from stapi_fastapi.conformance import API
 from stapi_fastapi.routers.root_router import RootRouter
 
@@ -40,4 +41,5 @@ root_router = RootRouter(
 root_router.add_product(product_test_spotlight_sync_opportunity)
 root_router.add_product(product_test_satellite_provider_sync_opportunity)
 app: FastAPI = FastAPI(lifespan=lifespan)
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
 app.include_router(root_router, prefix="")
@@ -16,3 +16,18 @@ def test_conformance(stapi_client: TestClient) -> None:
 
 def test_all() -> None:
     assert API.all() == [API.core, API.order_statuses, API.searches_opportunity, API.searches_opportunity_statuses]
+
+
+def test_conformance_not_modified(stapi_client: TestClient) -> None:
+    res = stapi_client.get("/conformance")
+    etag = res.headers["ETag"]
+
+    res = stapi_client.get("/conformance", headers={"If-None-Match": etag})
+
+    assert res.status_code == status.HTTP_304_NOT_MODIFIED
+    assert res.headers["ETag"] == etag
+    assert res.content == b""
+
+    res = stapi_client.get("/conformance", headers={"If-None-Match": '"stale"'})
+
+    assert res.status_code == status.HTTP_200_OK
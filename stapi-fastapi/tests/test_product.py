@@ -4,7 +4,15 @@ from fastapi.testclient import TestClient
 from stapi_fastapi.models.product import Product
 from stapi_pydantic import Conformance
 
-from .shared import pagination_tester
+from .backends import mock_create_order, mock_get_opportunity_collection, mock_search_opportunities_async
+from .shared import (
+    MyOpportunityProperties,
+    MyOrderParameters,
+    MyProductQueryables,
+    pagination_tester,
+    product_test_spotlight_sync_opportunity,
+    provider,
+)
 
 
 def test_products_response(stapi_client: TestClient):
@@ -151,3 +159,52 @@ def test_no_products(stapi_client: TestClient):
     print("hold")
     assert res.status_code == status.HTTP_200_OK
     assert len(body["products"]) == 0
+
+
+@pytest.mark.mock_products([product_test_spotlight_sync_opportunity, product_test_spotlight_sync_opportunity])
+def test_add_product_twice_mounts_routes_once(stapi_client: TestClient) -> None:
+    paths = [route.path for route in stapi_client.app.routes]  # type: ignore
+    assert paths.count("/products/test-spotlight") == 1
+
+    res = stapi_client.get("/products")
+    assert [product["id"] for product in res.json()["products"]] == ["test-spotlight"]
+
+
+@pytest.mark.mock_products(
+    [
+        product_test_spotlight_sync_opportunity,
+        product_test_spotlight_sync_opportunity.model_copy(update={"title": "Replacement Spotlight Product"}),
+    ]
+)
+def test_add_product_with_same_id_replaces_routes(stapi_client: TestClient) -> None:
+    paths = [route.path for route in stapi_client.app.routes]  # type: ignore
+    assert paths.count("/products/test-spotlight") == 1
+
+    res = stapi_client.get("/products/test-spotlight")
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json()["title"] == "Replacement Spotlight Product"
+
+
+@pytest.mark.parametrize(
+    "search_opportunities_async, get_opportunity_collection",
+    [(mock_search_opportunities_async, None), (None, mock_get_opportunity_collection)],
+)
+def test_product_requires_both_async_opportunity_callables(
+    search_opportunities_async, get_opportunity_collection
+) -> None:
+    with pytest.raises(ValueError, match="must be provided if either is provided"):
+        Product(
+            id="test-spotlight",
+            title="Test Spotlight Product",
+            description="Test product for test spotlight",
+            license="CC-BY-4.0",
+            keywords=["test", "satellite"],
+            providers=[provider],
+            links=[],
+            create_order=mock_create_order,
+            search_opportunities_async=search_opportunities_async,
+            get_opportunity_collection=get_opportunity_collection,
+            queryables=MyProductQueryables,
+            opportunity_properties=MyOpportunityProperties,
+            order_parameters=MyOrderParameters,
+        )